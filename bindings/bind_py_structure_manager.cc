@@ -1063,6 +1063,59 @@ namespace rascal {
             py::arg("positions"), py::arg("atom_types"), py::arg("cell"),
             py::arg("pbc"), py::arg("center_atoms_mask"),
             py::call_guard<py::gil_scoped_release>())
+        .def(
+            "extend",
+            [](AtomicStructureList_t & v,
+               const py::EigenDRef<const Eigen::MatrixXd> & positions,
+               const py::EigenDRef<const Eigen::VectorXi> & atom_types,
+               const py::EigenDRef<const Eigen::MatrixXd> & cells,
+               const py::EigenDRef<const Eigen::MatrixXi> & pbcs,
+               ArrayConstRef_t<bool> center_atoms_mask,
+               const py::EigenDRef<const Eigen::VectorXi> & offsets) {
+              // the structures are stored contiguously: the atoms of the
+              // i-th structure are in [offsets(i), offsets(i+1)), its cell
+              // in the columns [3*i, 3*i+3) and its pbc in the column i
+              auto n_structures{offsets.size() - 1};
+              auto n_atoms_total{positions.cols()};
+              if (n_structures < 0 or cells.cols() != 3 * n_structures or
+                  pbcs.cols() != n_structures or
+                  atom_types.size() != n_atoms_total or
+                  center_atoms_mask.size() != n_atoms_total or
+                  offsets(0) != 0 or
+                  offsets(n_structures) != n_atoms_total) {
+                throw std::runtime_error(
+                    R"(The batched structure arrays are not consistent with
+                       the offsets)");
+              }
+              for (Eigen::Index i_structure{0}; i_structure < n_structures;
+                   ++i_structure) {
+                if (offsets(i_structure + 1) < offsets(i_structure)) {
+                  throw std::runtime_error(
+                      R"(The offsets of the batched structures must not
+                         decrease)");
+                }
+              }
+              v.reserve(v.size() + n_structures);
+              for (Eigen::Index i_structure{0}; i_structure < n_structures;
+                   ++i_structure) {
+                auto start{offsets(i_structure)};
+                auto n_atoms{offsets(i_structure + 1) - start};
+                v.emplace_back();
+                v.back().set_structure(
+                    positions.middleCols(start, n_atoms),
+                    atom_types.segment(start, n_atoms),
+                    cells.middleCols(3 * i_structure, 3),
+                    pbcs.col(i_structure),
+                    center_atoms_mask.segment(start, n_atoms));
+              }
+            },
+            py::arg("positions"), py::arg("atom_types"), py::arg("cells"),
+            py::arg("pbcs"), py::arg("center_atoms_mask"), py::arg("offsets"),
+            R"(Append several structures at once. The per-atom arrays of all
+            the structures are concatenated and `offsets` holds the index of
+            the first atom of each structure followed by the total number
+            of atoms.)",
+            py::call_guard<py::gil_scoped_release>())
         .def("__len__",
              [](const AtomicStructureList_t & v) { return v.size(); })
         .def(
@@ -137,6 +137,12 @@ class Kernel(BaseIO):
         """
         if isinstance(X, AtomsList):
             X = X.managers
+        if isinstance(Y, AtomsList) and Y.managers is X:
+            Y = X
+        if Y is X and self.kernel_type == "Full":
+            # the kernel of a set with itself is symmetric so use the
+            # computation that only evaluates half of it
+            Y = None
         if Y is None and grad == (False, False):
             # compute a kernel between features and themselves
             if self.kernel_type == "Full":
@@ -8,6 +8,7 @@ Public functions:
     train_gap_model         Train a GAP model given a kernel matrix and sparse points
 """
 from ..utils import BaseIO
+from ..neighbourlist import AtomsList
 from ..lib import compute_sparse_kernel_gradients, compute_sparse_kernel_neg_stress
 
 import numpy as np
@@ -67,26 +68,32 @@ class KRR(BaseIO):
 
     def _get_property_baseline(self, managers):
         """build total baseline contribution for each prediction"""
-        if self.target_type == "Structure":
-            Y0 = np.zeros(len(managers))
-            for i_manager, manager in enumerate(managers):
+        if isinstance(managers, AtomsList):
+            if len(managers) > 0:
+                # structure index and atomic species of each center
+                info = managers.get_representation_info()
+                i_structure, species = info[:, 0], info[:, 2]
+            else:
+                i_structure = species = np.zeros(0, dtype=int)
+        else:
+            species = []
+            for manager in managers:
                 if isinstance(manager, ase.Atoms):
-                    numbers = manager.get_atomic_numbers()
-                    for sp in numbers:
-                        Y0[i_manager] += self.self_contributions[sp]
+                    species.append(manager.get_atomic_numbers())
                 else:
-                    for at in manager:
-                        Y0[i_manager] += self.self_contributions[at.atom_type]
-        elif self.target_type == "Atom":
-            n_centers = 0
-            for manager in managers:
-                n_centers += len(manager)
-            Y0 = np.zeros(n_centers)
-            i_center = 0
-            for manager in managers:
-                for center in manager:
-                    Y0[i_center] = self.self_contributions[center.atom_type]
-                    i_center += 1
+                    species.append([center.atom_type for center in manager])
+            n_centers = [len(sp) for sp in species]
+            i_structure = np.repeat(np.arange(len(managers)), n_centers)
+            species = np.concatenate(species) if species else np.zeros(0, dtype=int)
+
+        # look up the contribution of each species only once
+        u_species, inverse = np.unique(species, return_inverse=True)
+        contributions = np.array(
+            [self.self_contributions[sp] for sp in u_species.tolist()], dtype=float
+        )
+        Y0 = contributions[inverse.reshape(-1)]
+        if self.target_type == "Structure":
+            Y0 = np.bincount(i_structure, weights=Y0, minlength=len(managers))
         return Y0
 
     def predict(self, managers, KNM=None):
@@ -255,13 +262,13 @@ def _get_kernel_strides(frames):
         strides for assigning the gradient entries for each structure
     """
     Nstructures = len(frames)
-    Ngrad_stride = [0]
-    Ngrads = 0
-    for frame in frames:
-        n_at = len(frame)
-        Ngrad_stride.append(n_at * 3)
-        Ngrads += n_at * 3
-    Ngrad_stride = np.cumsum(Ngrad_stride) + Nstructures
+    n_grads = 3 * np.fromiter(
+        (len(frame) for frame in frames), dtype=int, count=Nstructures
+    )
+    Ngrad_stride = np.zeros(Nstructures + 1, dtype=int)
+    np.cumsum(n_grads, out=Ngrad_stride[1:])
+    Ngrads = int(Ngrad_stride[-1])
+    Ngrad_stride += Nstructures
     return Nstructures, Ngrads, Ngrad_stride
 
 
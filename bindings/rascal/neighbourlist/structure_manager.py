@@ -245,7 +245,8 @@ def convert_to_structure_list(frames):
     elif not isinstance(frames, Iterable):
         raise ValueError("Must pass either an ase.Atoms object or an iterable")
 
-    structure_list = neighbour_list.AtomicStructureList()
+    positions, atom_types, cells, pbcs, center_atoms_mask = [], [], [], [], []
+    n_atoms = [0]
     for frame in frames:
         if is_valid_structure(frame):
             structure = frame
@@ -258,7 +259,28 @@ def convert_to_structure_list(frames):
                 )
 
         structure = sanitize_non_periodic_structure(structure)
-        structure_list.append(**structure)
+        positions.append(structure["positions"])
+        atom_types.append(np.reshape(structure["atom_types"], (-1,)))
+        cells.append(structure["cell"])
+        pbcs.append(np.reshape(structure["pbc"], (3, 1)))
+        n_atoms.append(atom_types[-1].shape[0])
+        if "center_atoms_mask" in structure:
+            center_atoms_mask.append(structure["center_atoms_mask"])
+        else:
+            center_atoms_mask.append(np.ones(n_atoms[-1], dtype=bool))
+
+    # the structures are handed over to C++ in a single call using
+    # contiguous buffers and the offset of the first atom of each structure
+    structure_list = neighbour_list.AtomicStructureList()
+    if len(positions) > 0:
+        structure_list.extend(
+            positions=np.concatenate(positions, axis=1),
+            atom_types=np.concatenate(atom_types),
+            cells=np.concatenate(cells, axis=1),
+            pbcs=np.concatenate(pbcs, axis=1),
+            center_atoms_mask=np.concatenate(center_atoms_mask).astype(bool),
+            offsets=np.cumsum(n_atoms),
+        )
     return structure_list
 
 
@@ -38,6 +38,17 @@ class SortedCoulombMatrix(BaseIO):
         Physical Review Letters, 108(5), 58301. https://doi.org/10.1103/PhysRevLett.108.058301
     """
 
+    _ALLOWED_HYPERS = frozenset(
+        {
+            "sorting_algorithm",
+            "central_cutoff",
+            "central_decay",
+            "interaction_cutoff",
+            "interaction_decay",
+            "size",
+        }
+    )
+
     def __init__(
         self,
         cutoff,
@@ -71,15 +82,9 @@ class SortedCoulombMatrix(BaseIO):
         Also updates the internal json-like representation
 
         """
-        allowed_keys = {
-            "sorting_algorithm",
-            "central_cutoff",
-            "central_decay",
-            "interaction_cutoff",
-            "interaction_decay",
-            "size",
+        hypers_clean = {
+            key: hypers[key] for key in hypers if key in self._ALLOWED_HYPERS
         }
-        hypers_clean = {key: hypers[key] for key in hypers if key in allowed_keys}
         self.hypers.update(hypers_clean)
 
     def transform(self, frames):
@@ -8,7 +8,6 @@ from .base import (
 from ..neighbourlist import AtomsList
 import numpy as np
 from ..utils import BaseIO
-from copy import deepcopy
 
 
 class SphericalCovariants(BaseIO):
@@ -146,6 +145,25 @@ class SphericalCovariants(BaseIO):
 
     """
 
+    _ALLOWED_HYPERS = frozenset(
+        {
+            "interaction_cutoff",
+            "cutoff_smooth_width",
+            "max_radial",
+            "max_angular",
+            "gaussian_sigma_type",
+            "gaussian_sigma_constant",
+            "soap_type",
+            "inversion_symmetry",
+            "covariant_lambda",
+            "cutoff_function",
+            "normalize",
+            "gaussian_density",
+            "radial_contribution",
+            "cutoff_function_parameters",
+        }
+    )
+
     def __init__(
         self,
         interaction_cutoff,
@@ -162,7 +180,7 @@ class SphericalCovariants(BaseIO):
         soap_type="LambdaSpectrum",
         inversion_symmetry=True,
         covariant_lambda=0,
-        cutoff_function_parameters=dict(),
+        cutoff_function_parameters=None,
     ):
         """Construct a SphericalExpansion representation
 
@@ -180,9 +198,12 @@ class SphericalCovariants(BaseIO):
             covariant_lambda=covariant_lambda,
         )
 
-        self.cutoff_function_parameters = deepcopy(cutoff_function_parameters)
-
-        cutoff_function_parameters.update(
+        if cutoff_function_parameters is None:
+            cutoff_function_parameters = dict()
+        self.cutoff_function_parameters = dict(cutoff_function_parameters)
+        # the caller's dict is left untouched
+        cutoff_function_parameters = dict(
+            cutoff_function_parameters,
             interaction_cutoff=interaction_cutoff,
             cutoff_smooth_width=cutoff_smooth_width,
         )
@@ -226,23 +247,9 @@ class SphericalCovariants(BaseIO):
         Also updates the internal json-like representation
 
         """
-        allowed_keys = {
-            "interaction_cutoff",
-            "cutoff_smooth_width",
-            "max_radial",
-            "max_angular",
-            "gaussian_sigma_type",
-            "gaussian_sigma_constant",
-            "soap_type",
-            "inversion_symmetry",
-            "covariant_lambda",
-            "cutoff_function",
-            "normalize",
-            "gaussian_density",
-            "radial_contribution",
-            "cutoff_function_parameters",
+        hypers_clean = {
+            key: hypers[key] for key in hypers if key in self._ALLOWED_HYPERS
         }
-        hypers_clean = {key: hypers[key] for key in hypers if key in allowed_keys}
         self.hypers.update(hypers_clean)
         return
 
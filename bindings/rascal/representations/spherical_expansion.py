@@ -8,7 +8,7 @@ from .base import (
 from ..neighbourlist import AtomsList
 import numpy as np
 from ..utils import BaseIO
-from copy import deepcopy
+from weakref import WeakValueDictionary
 
 
 class SphericalExpansion(BaseIO):
@@ -158,6 +158,10 @@ class SphericalExpansion(BaseIO):
     transform(frames)
         Compute the representation for a list of ase.Atoms object.
 
+    invalidate(frames)
+        Discard the neighbourlist kept for reuse for a list of ase.Atoms
+        object.
+
 
     .. [soap] Bartók, Kondor, and Csányi, "On representing chemical
         environments", Phys. Rev. B. 87(18), p. 184115
@@ -165,6 +169,24 @@ class SphericalExpansion(BaseIO):
 
     """
 
+    _ALLOWED_HYPERS = frozenset(
+        {
+            "interaction_cutoff",
+            "cutoff_smooth_width",
+            "max_radial",
+            "max_angular",
+            "gaussian_sigma_type",
+            "gaussian_sigma_constant",
+            "gaussian_density",
+            "cutoff_function",
+            "radial_contribution",
+            "compute_gradients",
+            "cutoff_function_parameters",
+            "expansion_by_species_method",
+            "global_species",
+        }
+    )
+
     def __init__(
         self,
         interaction_cutoff,
@@ -180,7 +202,7 @@ class SphericalExpansion(BaseIO):
         expansion_by_species_method="environment wise",
         global_species=None,
         compute_gradients=False,
-        cutoff_function_parameters=dict(),
+        cutoff_function_parameters=None,
     ):
         """Construct a SphericalExpansion representation
 
@@ -203,8 +225,12 @@ class SphericalExpansion(BaseIO):
             global_species=global_species,
             compute_gradients=compute_gradients,
         )
-        self.cutoff_function_parameters = deepcopy(cutoff_function_parameters)
-        cutoff_function_parameters.update(
+        if cutoff_function_parameters is None:
+            cutoff_function_parameters = dict()
+        self.cutoff_function_parameters = dict(cutoff_function_parameters)
+        # the caller's dict is left untouched
+        cutoff_function_parameters = dict(
+            cutoff_function_parameters,
             interaction_cutoff=interaction_cutoff,
             cutoff_smooth_width=cutoff_smooth_width,
         )
@@ -237,35 +263,24 @@ class SphericalExpansion(BaseIO):
 
         self.rep_options = dict(name=self.name, args=[self.hypers])
 
-        n_features = self.get_num_coefficients()
-
         self._representation = CalculatorFactory(self.rep_options)
 
+        # neighbourlists kept by transform(reuse_neighbourlist=True), they
+        # are only kept alive by the caller
+        self._atoms_lists = WeakValueDictionary()
+
     def update_hyperparameters(self, **hypers):
         """Store the given dict of hyperparameters
 
         Also updates the internal json-like _representation
 
         """
-        allowed_keys = {
-            "interaction_cutoff",
-            "cutoff_smooth_width",
-            "max_radial",
-            "max_angular",
-            "gaussian_sigma_type",
-            "gaussian_sigma_constant",
-            "gaussian_density",
-            "cutoff_function",
-            "radial_contribution",
-            "compute_gradients",
-            "cutoff_function_parameters",
-            "expansion_by_species_method",
-            "global_species",
+        hypers_clean = {
+            key: hypers[key] for key in hypers if key in self._ALLOWED_HYPERS
         }
-        hypers_clean = {key: hypers[key] for key in hypers if key in allowed_keys}
         self.hypers.update(hypers_clean)
 
-    def transform(self, frames):
+    def transform(self, frames, reuse_neighbourlist=False):
         """Compute the representation.
 
         Parameters
@@ -273,17 +288,37 @@ class SphericalExpansion(BaseIO):
         frames : list(ase.Atoms) or AtomsList
             List of atomic structures.
 
+        reuse_neighbourlist : bool
+            If True, the AtomsList built for this list of frames is kept and
+            the later calls with reuse_neighbourlist=True return it again,
+            recomputed in place, as long as it is still alive. The features
+            obtained from the earlier calls are then overwritten. Moving the
+            atoms in place is not detected: use `invalidate(frames)` after
+            modifying the frames.
+
         Returns
         -------
            AtomsList : Object containing the representation
 
         """
         if not isinstance(frames, AtomsList):
-            frames = AtomsList(frames, self.nl_options)
+            if reuse_neighbourlist:
+                atoms_list = self._atoms_lists.get(id(frames))
+                if atoms_list is None or atoms_list._frames is not frames:
+                    atoms_list = AtomsList(frames, self.nl_options)
+                    self._atoms_lists[id(frames)] = atoms_list
+            else:
+                atoms_list = AtomsList(frames, self.nl_options)
+            frames = atoms_list
 
         self._representation.compute(frames.managers)
         return frames
 
+    def invalidate(self, frames):
+        """Forget the neighbourlist kept by transform for this list of frames
+        so that the next transform rebuilds it, e.g. after moving atoms."""
+        self._atoms_lists.pop(id(frames), None)
+
     def get_num_coefficients(self, n_species=1):
         """Return the number of coefficients in the spherical expansion
 
@@ -1,6 +1,6 @@
 import json
-from itertools import product
-import ase
+from collections import namedtuple
+from functools import lru_cache
 
 from .base import (
     CalculatorFactory,
@@ -9,21 +9,70 @@ from .base import (
 )
 
 from ..neighbourlist import AtomsList
+from ..neighbourlist.structure_manager import is_ase_Atoms
 import numpy as np
-from copy import deepcopy
 from ..utils import BaseIO
+from weakref import WeakValueDictionary
+
+
+class FeatureMapping(namedtuple("FeatureMapping", ["a", "b", "n1", "n2", "l"])):
+    """Indices of the coefficient corresponding to each feature of the power
+    spectrum: the species pair (a, b), the radial indices (n1, n2) and the
+    angular index l. Each field is an array indexed by the linear index of
+    the feature. Use as_dict to get the per-feature mapping returned by
+    get_power_spectrum_index_mapping.
+    """
+
+    __slots__ = ()
+
+    def as_dict(self):
+        """Return the mapping as a dictionary {i_feat: dict(a, b, n1, n2, l)}"""
+        columns = [index.tolist() for index in self]
+        return {
+            i_feat: dict(zip(self._fields, coeff_idx))
+            for i_feat, coeff_idx in enumerate(zip(*columns))
+        }
 
 
 def get_power_spectrum_index_mapping(sp_pairs, n_max, l_max):
-    feat_idx2coeff_idx = {}
-    # i_feat corresponds the global linear index
-    i_feat = 0
-    for sp_pair, n1, n2, l in product(
-        sp_pairs, range(n_max), range(n_max), range(l_max)
-    ):
-        feat_idx2coeff_idx[i_feat] = dict(a=sp_pair[0], b=sp_pair[1], n1=n1, n2=n2, l=l)
-        i_feat += 1
-    return feat_idx2coeff_idx
+    """Mapping {i_feat: dict(a, b, n1, n2, l)} from the linear index of the
+    power spectrum features to the indices of the corresponding coefficient"""
+    return get_power_spectrum_index_arrays(sp_pairs, n_max, l_max).as_dict()
+
+
+def get_power_spectrum_index_arrays(sp_pairs, n_max, l_max):
+    """Same as get_power_spectrum_index_mapping but stored as a FeatureMapping
+    of read-only arrays indexed by the linear index of the features"""
+    # hashable copy of the keys for the cache
+    sp_pairs = tuple((int(sp1), int(sp2)) for sp1, sp2 in sp_pairs)
+    return _get_power_spectrum_index_arrays(sp_pairs, int(n_max), int(l_max))
+
+
+@lru_cache(maxsize=32)
+def _get_power_spectrum_index_arrays(sp_pairs, n_max, l_max):
+    # the mapping is shared between the callers so it is made read-only
+    sp_pairs = np.array(sp_pairs, dtype=np.int32).reshape(-1, 2)
+    n_pairs = sp_pairs.shape[0]
+    # i_feat, the global linear index, runs over (sp_pair, n1, n2, l) with
+    # the last index running fastest. The indices are broadcast directly
+    # into a single preallocated buffer.
+    indices = np.empty((5, n_pairs, n_max, n_max, l_max), dtype=np.int32)
+    indices[0] = sp_pairs[:, 0, None, None, None]
+    indices[1] = sp_pairs[:, 1, None, None, None]
+    indices[2] = np.arange(n_max)[:, None, None]
+    indices[3] = np.arange(n_max)[:, None]
+    indices[4] = np.arange(l_max)
+    indices = indices.reshape(5, -1)
+    indices.flags.writeable = False
+    return FeatureMapping(*indices)
+
+
+def _atom_types_array(managers):
+    """Atomic species of all the centers of an AtomsList, gathered in a single
+    call to the C++ side"""
+    if len(managers) == 0:
+        return np.zeros(0, dtype=int)
+    return managers.get_representation_info()[:, 2]
 
 
 class SphericalInvariants(BaseIO):
@@ -199,6 +248,17 @@ class SphericalInvariants(BaseIO):
     transform(frames)
         Compute the representation for a list of ase.Atoms object.
 
+    invalidate(frames)
+        Discard the neighbourlist kept for reuse for a list of ase.Atoms
+        object.
+
+    get_feature_index_mapping(managers)
+        Dictionary giving, for each column of the feature matrix, the indices
+        (a, b, n1, n2, l) of the corresponding coefficient.
+
+    get_feature_index_arrays(managers)
+        The same indices as a FeatureMapping of arrays, one per index.
+
 
     .. [soap] Bartók, Kondor, and Csányi, "On representing chemical
         environments", Phys. Rev. B. 87(18), p. 184115
@@ -206,6 +266,28 @@ class SphericalInvariants(BaseIO):
 
     """
 
+    _ALLOWED_HYPERS = frozenset(
+        {
+            "interaction_cutoff",
+            "cutoff_smooth_width",
+            "max_radial",
+            "max_angular",
+            "gaussian_sigma_type",
+            "gaussian_sigma_constant",
+            "soap_type",
+            "inversion_symmetry",
+            "cutoff_function",
+            "normalize",
+            "gaussian_density",
+            "radial_contribution",
+            "cutoff_function_parameters",
+            "expansion_by_species_method",
+            "compute_gradients",
+            "global_species",
+            "coefficient_subselection",
+        }
+    )
+
     def __init__(
         self,
         interaction_cutoff,
@@ -224,7 +306,7 @@ class SphericalInvariants(BaseIO):
         expansion_by_species_method="environment wise",
         global_species=None,
         compute_gradients=False,
-        cutoff_function_parameters=dict(),
+        cutoff_function_parameters=None,
         coefficient_subselection=None,
     ):
         """Construct a SphericalExpansion representation
@@ -254,8 +336,12 @@ class SphericalInvariants(BaseIO):
         if self.hypers["coefficient_subselection"] is None:
             del self.hypers["coefficient_subselection"]
 
-        self.cutoff_function_parameters = deepcopy(cutoff_function_parameters)
-        cutoff_function_parameters.update(
+        if cutoff_function_parameters is None:
+            cutoff_function_parameters = dict()
+        self.cutoff_function_parameters = dict(cutoff_function_parameters)
+        # the caller's dict is left untouched
+        cutoff_function_parameters = dict(
+            cutoff_function_parameters,
             interaction_cutoff=interaction_cutoff,
             cutoff_smooth_width=cutoff_smooth_width,
         )
@@ -293,37 +379,24 @@ class SphericalInvariants(BaseIO):
 
         self._representation = CalculatorFactory(self.rep_options)
 
+        # neighbourlists kept by transform(reuse_neighbourlist=True), they
+        # are only kept alive by the caller
+        self._atoms_lists = WeakValueDictionary()
+
     def update_hyperparameters(self, **hypers):
         """Store the given dict of hyperparameters
 
         Also updates the internal json-like representation
 
         """
-        allowed_keys = {
-            "interaction_cutoff",
-            "cutoff_smooth_width",
-            "max_radial",
-            "max_angular",
-            "gaussian_sigma_type",
-            "gaussian_sigma_constant",
-            "soap_type",
-            "inversion_symmetry",
-            "cutoff_function",
-            "normalize",
-            "gaussian_density",
-            "radial_contribution",
-            "cutoff_function_parameters",
-            "expansion_by_species_method",
-            "compute_gradients",
-            "global_species",
-            "coefficient_subselection",
+        hypers_clean = {
+            key: hypers[key] for key in hypers if key in self._ALLOWED_HYPERS
         }
-        hypers_clean = {key: hypers[key] for key in hypers if key in allowed_keys}
 
         self.hypers.update(hypers_clean)
         return
 
-    def transform(self, frames):
+    def transform(self, frames, reuse_neighbourlist=False):
         """Compute the representation.
 
         Parameters
@@ -331,55 +404,63 @@ class SphericalInvariants(BaseIO):
         frames : list(ase.Atoms) or AtomsList
             List of atomic structures.
 
+        reuse_neighbourlist : bool
+            If True, the AtomsList built for this list of frames is kept and
+            the later calls with reuse_neighbourlist=True return it again,
+            recomputed in place, as long as it is still alive. The features
+            obtained from the earlier calls are then overwritten. Moving the
+            atoms in place is not detected: use `invalidate(frames)` after
+            modifying the frames.
+
         Returns
         -------
            AtomsList : Object containing the representation
 
         """
         if not isinstance(frames, AtomsList):
-            frames = AtomsList(frames, self.nl_options)
+            if reuse_neighbourlist:
+                atoms_list = self._atoms_lists.get(id(frames))
+                if atoms_list is None or atoms_list._frames is not frames:
+                    atoms_list = AtomsList(frames, self.nl_options)
+                    self._atoms_lists[id(frames)] = atoms_list
+            else:
+                atoms_list = AtomsList(frames, self.nl_options)
+            frames = atoms_list
 
         self._representation.compute(frames.managers)
 
         return frames
 
+    def invalidate(self, frames):
+        """Forget the neighbourlist kept by transform for this list of frames
+        so that the next transform rebuilds it, e.g. after moving atoms."""
+        self._atoms_lists.pop(id(frames), None)
+
     def get_num_coefficients(self, n_species=1):
         """Return the number of coefficients in the representation
 
         (this is the descriptor size per atomic centre)
 
         """
+        n_max = self.hypers["max_radial"]
+        l_max = self.hypers["max_angular"]
         if self.hypers["soap_type"] == "RadialSpectrum":
-            return n_species * self.hypers["max_radial"]
+            return n_species * n_max
         if self.hypers["soap_type"] == "PowerSpectrum":
-            return (
-                int((n_species * (n_species + 1)) / 2)
-                * self.hypers["max_radial"] ** 2
-                * (self.hypers["max_angular"] + 1)
-            )
+            return (n_species * (n_species + 1)) // 2 * n_max ** 2 * (l_max + 1)
         if self.hypers["soap_type"] == "BiSpectrum":
             if not self.hypers["inversion_symmetry"]:
+                # l_max^2 * (l_max + 3) is always even
                 return (
                     n_species ** 3
-                    * self.hypers["max_radial"] ** 3
-                    * int(
-                        1
-                        + 2 * self.hypers["max_angular"]
-                        + 3 * self.hypers["max_angular"] ** 2 / 2
-                        + self.hypers["max_angular"] ** 3 / 2
-                    )
+                    * n_max ** 3
+                    * (1 + 2 * l_max + (l_max ** 2 * (l_max + 3)) // 2)
                 )
             else:
                 return (
                     n_species ** 3
-                    * self.hypers["max_radial"] ** 3
-                    * int(
-                        np.floor(
-                            ((self.hypers["max_angular"] + 1) ** 2 + 1)
-                            * (2 * (self.hypers["max_angular"] + 1) + 3)
-                            / 8.0
-                        )
-                    )
+                    * n_max ** 3
+                    * ((((l_max + 1) ** 2 + 1) * (2 * (l_max + 1) + 3)) // 8)
                 )
         else:
             raise ValueError(
@@ -392,51 +473,60 @@ class SphericalInvariants(BaseIO):
         """
         return the proper list of keys used to build the representation
         """
-        keys = []
+        species = np.asarray(species)
         if self.hypers["soap_type"] == "RadialSpectrum":
-            for sp in species:
-                keys.append([sp])
+            keys = species.reshape(-1, 1)
         elif self.hypers["soap_type"] == "PowerSpectrum":
-            for sp1 in species:
-                for sp2 in species:
-                    if sp1 > sp2:
-                        continue
-                    keys.append([sp1, sp2])
+            # all the pairs in the order of the species list such that
+            # sp1 <= sp2
+            sp1, sp2 = [
+                sp.flatten() for sp in np.meshgrid(species, species, indexing="ij")
+            ]
+            keys = np.stack([sp1, sp2], axis=1)[sp1 <= sp2]
         elif self.hypers["soap_type"] == "BiSpectrum":
-            for sp1 in species:
-                for sp2 in species:
-                    if sp1 > sp2:
-                        continue
-                    for sp3 in species:
-                        if sp2 > sp3:
-                            continue
-                        keys.append([sp1, sp2, sp3])
+            sp1, sp2, sp3 = [
+                sp.flatten()
+                for sp in np.meshgrid(species, species, species, indexing="ij")
+            ]
+            keys = np.stack([sp1, sp2, sp3], axis=1)[(sp1 <= sp2) & (sp2 <= sp3)]
         else:
             raise ValueError(
                 "Only soap_type = RadialSpectrum || "
                 "PowerSpectrum || BiSpectrum "
                 "implemented for now"
             )
-        return keys
+        return keys.tolist()
 
     def get_feature_index_mapping(self, managers):
-
-        species = []
-        for ii in range(len(managers)):
-            manager = managers[ii]
-            if isinstance(manager, ase.Atoms):
-                species.extend(manager.get_atomic_numbers())
-            elif isinstance(managers, AtomsList):
-                for center in manager:
-                    sp = center.atom_type
-                    species.append(sp)
+        """Mapping {i_feat: dict(a, b, n1, n2, l)} from the columns of the
+        feature matrix of managers to the indices of the coefficients"""
+        return self.get_feature_index_arrays(managers).as_dict()
+
+    def get_feature_index_arrays(self, managers):
+        """Same as get_feature_index_mapping but stored as a FeatureMapping of
+        arrays indexed by the columns of the feature matrix"""
+        if isinstance(managers, AtomsList):
+            species = _atom_types_array(managers)
+        else:
+            if is_ase_Atoms(managers):
+                managers = [managers]
+            frames = list(managers)
+            for frame in frames:
+                if not is_ase_Atoms(frame):
+                    raise RuntimeError(
+                        "Cannot get the species of a structure of type {}".format(
+                            type(frame)
+                        )
+                    )
+            species = [frame.get_atomic_numbers() for frame in frames]
+            species = np.concatenate(species) if species else np.zeros(0, dtype=int)
         u_species = np.unique(species)
         sp_pairs = self.get_keys(u_species)
 
         n_max = self.hypers["max_radial"]
         l_max = self.hypers["max_angular"] + 1
         if self.hypers["soap_type"] == "PowerSpectrum":
-            feature_index_mapping = get_power_spectrum_index_mapping(
+            feature_index_mapping = get_power_spectrum_index_arrays(
                 sp_pairs, n_max, l_max
             )
         else:
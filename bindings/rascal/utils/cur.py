@@ -231,20 +231,19 @@ class CURFilter(BaseIO):
             # return pseudo_points
 
         elif self.act_on == "feature":
-            feat_idx2coeff_idx = self._representation.get_feature_index_mapping(
+            feat_idx2coeff_idx = self._representation.get_feature_index_arrays(
                 managers
             )
-            self.selected_ids = {key: [] for key in feat_idx2coeff_idx[0].keys()}
             selected_ids_sorting = np.argsort(
                 self.selected_feature_ids_global[:n_select]
             )
             selected_feature_ids = self.selected_feature_ids_global[
                 selected_ids_sorting
             ]
-            for idx in selected_feature_ids:
-                coef_idx = feat_idx2coeff_idx[idx]
-                for key in self.selected_ids.keys():
-                    self.selected_ids[key].append(int(coef_idx[key]))
+            self.selected_ids = {
+                key: coef_idx[selected_feature_ids].tolist()
+                for key, coef_idx in feat_idx2coeff_idx._asdict().items()
+            }
             # keep the global indices and ordering for ease of use
             self.selected_ids[
                 "selected_features_global_ids"
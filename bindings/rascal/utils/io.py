@@ -1,9 +1,9 @@
 import os
 import importlib
+import base64
 from collections import Iterable
 import numpy as np
 import json
-from copy import deepcopy
 from abc import ABC, abstractmethod
 
 BETA_VERSION = "0.1"
@@ -12,6 +12,9 @@ CURRENT_VERSION = BETA_VERSION
 
 MAX_RECURSION_DEPTH = 20
 
+# types that can not hold a nested object so they are transferred as is
+_ATOMIC_TYPES = frozenset({int, float, str, bool, type(None), bytes})
+
 
 def dump_obj(fn, instance, version=CURRENT_VERSION):
     """Save a python object that inherits from the BaseIO class
@@ -187,26 +190,20 @@ def dict2obj_beta(data):
     return obj
 
 
-def is_valid_object_dict_beta(data):
-    """check compatibility of data to be used in dict2obj_beta"""
-    valid_keys = [
+_VALID_KEYS_BETA = frozenset(
+    [
         "version",
         "class_name",
         "module_name",
         "init_params",
         "data",
     ]
-    aa = []
-    if isinstance(data, dict):
-        for k in data:
-            if k in valid_keys:
-                aa.append(True)
-        if len(aa) == len(valid_keys):
-            return True
-        else:
-            return False
-    else:
-        return False
+)
+
+
+def is_valid_object_dict_beta(data):
+    """check compatibility of data to be used in dict2obj_beta"""
+    return isinstance(data, dict) and _VALID_KEYS_BETA.issubset(data)
 
 
 obj2dict = {BETA_VERSION: obj2dict_beta}
@@ -299,7 +296,9 @@ def to_dict(obj, version=CURRENT_VERSION, recursion_depth=0):
         if isinstance(entry, dict):
             # case of potentially nested objects
             for k, v in entry.items():
-                if isinstance(v, BaseIO):
+                if type(v) in _ATOMIC_TYPES:
+                    continue
+                elif isinstance(v, BaseIO):
                     state[name][k] = to_dict(v, version, recursion_depth)
                 elif isinstance(v, list):
                     # make sure list of objects are properly serialized
@@ -319,11 +318,15 @@ def from_dict(data):
     # temporary dictionary to hold the object being recovered
     data_obj = dict()
     version = data["version"]
+    is_valid_object = is_valid_object_dict[version]
     for name, entry in data.items():
         if isinstance(entry, dict):
             data_obj[name] = dict()
             for k, v in entry.items():
-                if is_valid_object_dict[version](v):
+                if type(v) in _ATOMIC_TYPES:
+                    # just transfer the data
+                    data_obj[name][k] = v
+                elif is_valid_object(v):
                     # in case of nested objects
                     data_obj[name][k] = from_dict(v)
                 elif isinstance(v, list):
@@ -331,7 +334,7 @@ def from_dict(data):
                     # objects
                     ll = []
                     for val in v:
-                        if is_valid_object_dict[version](val):
+                        if type(val) not in _ATOMIC_TYPES and is_valid_object(val):
                             ll.append(from_dict(val))
                         else:
                             ll.append(val)
@@ -389,23 +392,42 @@ def _dump_npy(fn, data, class_name):
 
     If the array is large (>50MB) main file contains a relative path to the *.npy
     file so that it can be loaded properly.
-    Small numpy array are converted to lists and saved in the main file."""
+    Small numpy array are saved in the main file as their base64 encoded raw
+    buffer together with their dtype description (as in the .npy header) and
+    shape."""
     filename, file_extension = os.path.splitext(fn)
+    _dump_npy_recursive(filename, data, class_name)
+
+
+def _dump_npy_recursive(filename, data, class_name):
+    """Implementation of _dump_npy() with the extension already removed from
+    the file name"""
+    if "class_name" in data:
+        data_class_name = data["class_name"].lower()
+    else:
+        data_class_name = class_name
     for k, v in data.items():
         if isinstance(v, dict):
-            if "class_name" in data:
-                class_name = data["class_name"].lower()
-            _dump_npy(fn, v, class_name)
+            _dump_npy_recursive(filename, v, data_class_name)
         elif is_large_array(v):
             if "tag" in data:
                 class_name += "-" + data["tag"]
             v_fn = filename + "-{}-{}".format(class_name, k) + ".npy"
             v_bfn = os.path.basename(v_fn)
             data[k] = v_bfn
-            np.save(v_fn, v)
+            np.save(v_fn, v, allow_pickle=False)
 
         elif is_npy(v):
-            data[k] = ["npy", v.tolist()]
+            if v.dtype.hasobject:
+                data[k] = ["npy", v.tolist()]
+            else:
+                buffer = np.ascontiguousarray(v).data
+                data[k] = [
+                    "npy_b64",
+                    np.lib.format.dtype_to_descr(v.dtype),
+                    list(v.shape),
+                    base64.b64encode(buffer).decode("ascii"),
+                ]
 
 
 def _load_npy(data, path):
@@ -417,8 +439,13 @@ def _load_npy(data, path):
         if isinstance(v, dict):
             _load_npy(v, path)
         elif is_npy_filename(v):
-            data[k] = np.load(os.path.join(path, v), mmap_mode="r")
+            data[k] = np.load(os.path.join(path, v), mmap_mode="r", allow_pickle=False)
         elif isinstance(v, list):
             if len(v) == 2:
                 if "npy" == v[0]:
                     data[k] = np.array(v[1])
+            elif len(v) == 4:
+                if "npy_b64" == v[0]:
+                    buffer = bytearray(base64.b64decode(v[3]))
+                    dtype = np.lib.format.descr_to_dtype(v[1])
+                    data[k] = np.frombuffer(buffer, dtype=dtype).reshape(v[2])
@@ -42,12 +42,12 @@ hypers = dict(
 )
 
 for fn in fns:
+    frame = read(fn)
     for cutoff in cutoffs:
         print(fn, cutoff)
         data["rep_info"].append([])
         for sort in sorts:
             rep = SortedCoulombMatrix(cutoff, sorting_algorithm=sort)
-            frame = read(fn)
             features = rep.transform(frame)
             test = features.get_features(rep)
             hypers["size"] = rep.size
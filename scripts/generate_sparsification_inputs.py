@@ -54,9 +54,8 @@ def dump_reference_json():
         hyp = deepcopy(hypers)
 
         # select some features from the possible set
-        mapping = soap.get_feature_index_mapping(managers)
-        selected_features = {key: [] for key in mapping[0].keys()}
-        ids = np.array([key for key in mapping.keys()])
+        mapping = soap.get_feature_index_arrays(managers)
+        ids = np.arange(len(mapping.l))
         if Nselect == "all":
             pass
         elif Nselect == "all_random":
@@ -66,10 +65,9 @@ def dump_reference_json():
             ids = ids[:8]
         else:
             raise NotImplementedError()
-        for idx in ids:
-            coef_idx = mapping[idx]
-            for key in selected_features.keys():
-                selected_features[key].append(int(coef_idx[key]))
+        selected_features = {
+            key: coef_idx[ids].tolist() for key, coef_idx in mapping._asdict().items()
+        }
         # selected_features_global_ids is important for the tests
         selected_features["selected_features_global_ids"] = ids.tolist()
         mapp = dict(coefficient_subselection=selected_features)
@@ -140,9 +140,6 @@ def main(json_dump, save_kernel):
 
     nstr = "2"  # number of structures
     frames = read(os.path.join(inputs_path, "water_rotations.xyz"), ":" + str(nstr))
-    species = set([atom for frame in frames for atom in frame.get_atomic_numbers()])
-    nspecies = len(species)
-    ncen = np.cumsum([len(frame) for frame in frames])[-1]
 
     x = get_feature_vector(test_hypers, frames)
     x0 = x.shape[0]
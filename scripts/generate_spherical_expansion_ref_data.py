@@ -6,12 +6,11 @@ sys.path.insert(0, "../build/")
 from ase.io import read
 import numpy as np
 import argparse
-import ase
-import json
+from copy import copy
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 from rascal.representations import SphericalExpansion
 from rascal.utils import ostream_redirect
-import rascal
-import rascal.lib as lrl
 
 root = os.path.abspath("../")
 rascal_reference_path = os.path.join(root, "reference_data/")
@@ -36,9 +35,29 @@ def get_soap_vectors(hypers, frames):
 # dump spherical expansion
 
 
+@lru_cache(maxsize=None)
+def load_frame(fn):
+    """Read each input structure only once per process"""
+    return read(fn)
+
+
+def compute_reference(job):
+    """Compute the reference features of one set of hypers for all the inputs"""
+    fns, hypers = job
+    sph_expn = SphericalExpansion(**hypers)
+    # one transform for all the inputs, the features are still taken per
+    # structure since their columns depend on the species present
+    expansions = sph_expn.transform([load_frame(fn) for fn in fns])
+    rep_infos = []
+    for i_frame in range(len(fns)):
+        x = expansions.get_subset([i_frame]).get_features(sph_expn)
+        np.putmask(x, np.abs(x) < 1e-300, 0.0)
+        rep_infos.append(dict(feature_matrix=x.tolist(), hypers=copy(sph_expn.hypers)))
+    return rep_infos
+
+
 def dump_reference_json():
     import ubjson
-    from copy import copy
     from itertools import product
 
     sys.path.insert(0, os.path.join(root, "build/"))
@@ -83,60 +102,67 @@ def dump_reference_json():
         rep_info=[],
     )
 
-    for fn in fns:
-        for cutoff in cutoffs:
-            data["rep_info"].append([])
-            for (
-                gaussian_sigma,
-                max_radial,
-                max_angular,
-                cutoff_smooth_width,
-                rad_basis,
-                cutoff_function_type,
-                opt_args,
-            ) in product(
-                gaussian_sigmas,
-                max_radials,
-                max_angulars,
-                cutoff_smooth_widths,
-                radial_basis,
-                cutoff_function_types,
-                optimization,
-            ):
-                frames = [read(fn)]
-                if cutoff_function_type == "RadialScaling":
-                    cutoff_function_parameters = dict(
-                        rate=1, scale=cutoff * 0.5, exponent=3
-                    )
-                else:
-                    cutoff_function_parameters = dict()
-
-                hypers = {
-                    "interaction_cutoff": cutoff,
-                    "cutoff_smooth_width": cutoff_smooth_width,
-                    "max_radial": max_radial,
-                    "max_angular": max_angular,
-                    "gaussian_sigma_type": "Constant",
-                    "cutoff_function_type": cutoff_function_type,
-                    "cutoff_function_parameters": cutoff_function_parameters,
-                    "gaussian_sigma_constant": gaussian_sigma,
-                    "radial_basis": rad_basis,
-                    "optimization": opt_args,
-                }
-
-                sph_expn = SphericalExpansion(**hypers)
-                expansions = sph_expn.transform(frames)
-                x = expansions.get_features(sph_expn)
-                x[np.abs(x) < 1e-300] = 0.0
-                data["rep_info"][-1].append(
-                    dict(feature_matrix=x.tolist(), hypers=copy(sph_expn.hypers))
+    # each set of hypers is built once and applied to all the input files
+    jobs = []
+    for cutoff in cutoffs:
+        jobs.append([])
+        for (
+            gaussian_sigma,
+            max_radial,
+            max_angular,
+            cutoff_smooth_width,
+            rad_basis,
+            cutoff_function_type,
+            opt_args,
+        ) in product(
+            gaussian_sigmas,
+            max_radials,
+            max_angulars,
+            cutoff_smooth_widths,
+            radial_basis,
+            cutoff_function_types,
+            optimization,
+        ):
+            if cutoff_function_type == "RadialScaling":
+                cutoff_function_parameters = dict(
+                    rate=1, scale=cutoff * 0.5, exponent=3
                 )
+            else:
+                cutoff_function_parameters = dict()
+
+            hypers = {
+                "interaction_cutoff": cutoff,
+                "cutoff_smooth_width": cutoff_smooth_width,
+                "max_radial": max_radial,
+                "max_angular": max_angular,
+                "gaussian_sigma_type": "Constant",
+                "cutoff_function_type": cutoff_function_type,
+                "cutoff_function_parameters": cutoff_function_parameters,
+                "gaussian_sigma_constant": gaussian_sigma,
+                "radial_basis": rad_basis,
+                "optimization": opt_args,
+            }
+
+            jobs[-1].append((fns, hypers))
+
+    # the hypers combinations are independent so they are computed in parallel
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(compute_reference, [job for row in jobs for job in row])
+        by_cutoff = [[next(results) for _ in row] for row in jobs]
+    # rep_info is ordered by input file and then by cutoff
+    data["rep_info"] = [
+        [rep_infos[i_fn] for rep_infos in row]
+        for i_fn in range(len(fns))
+        for row in by_cutoff
+    ]
 
     with open(
         os.path.join(root, dump_path, "spherical_expansion_reference.ubjson"),
         "wb",
     ) as f:
-        ubjson.dump(data, f)
+        # the feature matrices stay nested lists of float64 since this is what
+        # the C++ tests read, counted containers let the reader preallocate
+        ubjson.dump(data, f, container_count=True)
 
 
 ###############################################################################
@@ -154,18 +180,17 @@ def main(json_dump, save_kernel):
         "gaussian_sigma_constant": 0.3,
     }
 
-    nmax = test_hypers["max_radial"]
-    lmax = test_hypers["max_angular"]
     nstr = "5"  # number of structures
 
     frames = read(os.path.join(inputs_path, "small_molecules-20.json"), ":" + str(nstr))
-    species = set([atom for frame in frames for atom in frame.get_atomic_numbers()])
-    nspecies = len(species)
-    ncen = np.cumsum([len(frame) for frame in frames])[-1]
 
     x = get_soap_vectors(test_hypers, frames)
     if save_kernel is True:
-        np.save(os.path.join(dump_path, "spherical_expansion_example.npy"), x)
+        np.save(
+            os.path.join(dump_path, "spherical_expansion_example.npy"),
+            x,
+            allow_pickle=False,
+        )
 
     # --------------------------dump json reference data--------------------------#
 
@@ -1,17 +1,17 @@
 from ase.io import read
 import numpy as np
 import argparse
-import ase
-import json
 import sys
 import os
+from copy import copy
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
+from scipy.linalg.blas import dsyrk
 
 sys.path.insert(0, "../build/")
 
-import rascal
 from rascal.utils import ostream_redirect
 from rascal.representations import SphericalInvariants
-import rascal.lib as lrl
 
 root = os.path.abspath("../")
 rascal_reference_path = os.path.join(root, "reference_data/")
@@ -33,12 +33,39 @@ def get_feature_vector(hypers, frames):
     return feature_vector
 
 
+def get_kernel(x):
+    """Linear kernel x x^T using the symmetric rank-k update of BLAS"""
+    # x.T is Fortran ordered so dsyrk works on x without copying it
+    kernel = dsyrk(1.0, x.T, trans=1)
+    return np.triu(kernel) + np.triu(kernel, 1).T
+
+
 ##############################################################################
 
 
+@lru_cache(maxsize=None)
+def load_frame(fn):
+    """Read each input structure only once per process"""
+    return read(fn)
+
+
+def compute_reference(job):
+    """Compute the reference features of one set of hypers for all the inputs"""
+    fns, hypers = job
+    soap = SphericalInvariants(**hypers)
+    # one transform for all the inputs, the features are still taken per
+    # structure since their columns depend on the species present
+    soap_vectors = soap.transform([load_frame(fn) for fn in fns])
+    rep_infos = []
+    for i_frame in range(len(fns)):
+        x = soap_vectors.get_subset([i_frame]).get_features(soap)
+        np.putmask(x, np.abs(x) < 1e-300, 0.0)
+        rep_infos.append(dict(feature_matrix=x.tolist(), hypers=copy(soap.hypers)))
+    return rep_infos
+
+
 def dump_reference_json():
     import ubjson
-    from copy import copy
     from itertools import product
 
     sys.path.insert(0, os.path.join(root, "build/"))
@@ -70,58 +97,72 @@ def dump_reference_json():
         rep_info=[],
     )
 
-    for fn in fns:
-        frames = read(fn)
-        for cutoff in cutoffs:
-            print(fn, cutoff)
-            data["rep_info"].append([])
-            for (
-                soap_type,
-                gaussian_sigma,
-                max_radial,
-                max_angular,
-                rad_basis,
-            ) in product(
-                soap_types,
-                gaussian_sigmas,
-                max_radials,
-                max_angulars,
-                radial_basis,
-            ):
-                if "RadialSpectrum" == soap_type:
-                    max_angular = 0
-                if "BiSpectrum" == soap_type:
-                    max_radial = 2
-                    max_angular = 1
-                    inversion_symmetry = True
-
-                hypers = {
-                    "interaction_cutoff": cutoff,
-                    "cutoff_smooth_width": 0.5,
-                    "max_radial": max_radial,
-                    "max_angular": max_angular,
-                    "gaussian_sigma_type": "Constant",
-                    "normalize": True,
-                    "cutoff_function_type": "ShiftedCosine",
-                    "radial_basis": rad_basis,
-                    "gaussian_sigma_constant": gaussian_sigma,
-                    "soap_type": soap_type,
-                    "inversion_symmetry": inversion_symmetry,
-                }
-
-                soap = SphericalInvariants(**hypers)
-                soap_vectors = soap.transform(frames)
-                x = soap_vectors.get_features(soap)
-                x[np.abs(x) < 1e-300] = 0.0
-                data["rep_info"][-1].append(
-                    dict(feature_matrix=x.tolist(), hypers=copy(soap.hypers))
-                )
+    # each set of hypers is built once and applied to all the input files
+    jobs = []
+    # RadialSpectrum and BiSpectrum override some of the grid values so the
+    # same hypers would otherwise be computed several times
+    seen = set()
+    for cutoff in cutoffs:
+        print(cutoff)
+        jobs.append([])
+        for (
+            soap_type,
+            gaussian_sigma,
+            max_radial,
+            max_angular,
+            rad_basis,
+        ) in product(
+            soap_types,
+            gaussian_sigmas,
+            max_radials,
+            max_angulars,
+            radial_basis,
+        ):
+            if "RadialSpectrum" == soap_type:
+                max_angular = 0
+            if "BiSpectrum" == soap_type:
+                max_radial = 2
+                max_angular = 1
+                inversion_symmetry = True
+
+            hypers = {
+                "interaction_cutoff": cutoff,
+                "cutoff_smooth_width": 0.5,
+                "max_radial": max_radial,
+                "max_angular": max_angular,
+                "gaussian_sigma_type": "Constant",
+                "normalize": True,
+                "cutoff_function_type": "ShiftedCosine",
+                "radial_basis": rad_basis,
+                "gaussian_sigma_constant": gaussian_sigma,
+                "soap_type": soap_type,
+                "inversion_symmetry": inversion_symmetry,
+            }
+
+            key = frozenset(hypers.items())
+            if key in seen:
+                continue
+            seen.add(key)
+            jobs[-1].append((fns, hypers))
+
+    # the hypers combinations are independent so they are computed in parallel
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(compute_reference, [job for row in jobs for job in row])
+        by_cutoff = [[next(results) for _ in row] for row in jobs]
+    # rep_info is ordered by input file and then by cutoff
+    data["rep_info"] = [
+        [rep_infos[i_fn] for rep_infos in row]
+        for i_fn in range(len(fns))
+        for row in by_cutoff
+    ]
 
     with open(
         os.path.join(root, dump_path, "spherical_invariants_reference.ubjson"),
         "wb",
     ) as f:
-        ubjson.dump(data, f)
+        # the feature matrices stay nested lists of float64 since this is what
+        # the C++ tests read, counted containers let the reader preallocate
+        ubjson.dump(data, f, container_count=True)
 
 
 #############################################################################
@@ -142,38 +183,37 @@ def main(json_dump, save_kernel):
         "soap_type": "PowerSpectrum",
     }
 
-    nmax = test_hypers["max_radial"]
-    lmax = test_hypers["max_angular"]
     nstr = "2"  # number of structures
 
     frames = read(os.path.join(inputs_path, "small_molecules-20.json"), ":" + str(nstr))
-    species = set([atom for frame in frames for atom in frame.get_atomic_numbers()])
-    nspecies = len(species)
-    # test_hypers["n_species"] = nspecies #not functional
-    ncen = np.cumsum([len(frame) for frame in frames])[-1]
 
     # --------------------------nu=1------------------------------------------#
 
     test_hypers["soap_type"] = "RadialSpectrum"
     x = get_feature_vector(test_hypers, frames)
-    kernel = np.dot(x, x.T)
+    kernel = get_kernel(x)
     if save_kernel is True:
-        np.save(os.path.join(dump_path, "kernel_soap_example_nu1.npy"), kernel)
+        np.save(
+            os.path.join(dump_path, "kernel_soap_example_nu1.npy"),
+            kernel,
+            allow_pickle=False,
+        )
 
     # ------------------------------------------nu=2------------------------------#
 
     test_hypers["soap_type"] = "PowerSpectrum"
     x = get_feature_vector(test_hypers, frames)
-    kernel = np.dot(x, x.T)
+    kernel = get_kernel(x)
     if save_kernel is True:
-        np.save(os.path.join(dump_path, "kernel_soap_example_nu2.npy"), kernel)
+        np.save(
+            os.path.join(dump_path, "kernel_soap_example_nu2.npy"),
+            kernel,
+            allow_pickle=False,
+        )
 
     # ------------------------------------------nu=3-----------------------------#
 
     frames = read(os.path.join(inputs_path, "water_rotations.xyz"), ":" + str(nstr))
-    species = set([atom for frame in frames for atom in frame.get_atomic_numbers()])
-    nspecies = len(species)
-    ncen = np.cumsum([len(frame) for frame in frames])[-1]
     nmax = 9
     lmax = 2
     test_hypers["soap_type"] = "BiSpectrum"
@@ -181,9 +221,13 @@ def main(json_dump, save_kernel):
     test_hypers["max_radial"] = nmax
     test_hypers["max_angular"] = lmax
     x = get_feature_vector(test_hypers, frames)
-    kernel = np.dot(x, x.T)
+    kernel = get_kernel(x)
     if save_kernel is True:
-        np.save(os.path.join(dump_path, "kernel_soap_example_nu3.npy"), kernel)
+        np.save(
+            os.path.join(dump_path, "kernel_soap_example_nu3.npy"),
+            kernel,
+            allow_pickle=False,
+        )
 
     # ------------------dump json reference data--------------------------------#
 
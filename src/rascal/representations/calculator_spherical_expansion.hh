@@ -139,6 +139,7 @@ namespace rascal {
                   << this->constant_gaussian_sigma << " < 1e-2";
           throw std::runtime_error(err_str.str());
         }
+        this->fac_a = 0.5 * math::pow(this->constant_gaussian_sigma, -2);
       }
       template <size_t Order, size_t Layer>
       double
@@ -146,7 +147,14 @@ namespace rascal {
         return this->constant_gaussian_sigma;
       }
       double get_gaussian_sigma() { return this->constant_gaussian_sigma; }
+      //! a = 1 / (2*\sigma^2), the same for every pair so it is precomputed
+      template <size_t Order, size_t Layer>
+      double get_fac_a(const ClusterRefKey<Order, Layer> & /* pair */) {
+        return this->fac_a;
+      }
+      double get_fac_a() { return this->fac_a; }
       double constant_gaussian_sigma{0.};
+      double fac_a{0.};
     };
 
     /** Per-species template specialization of the above */
@@ -163,6 +171,12 @@ namespace rascal {
                                "been implemented");
         return -1;
       }
+      template <size_t Order, size_t Layer>
+      double get_fac_a(const ClusterRefKey<Order, Layer> & /* pair */) {
+        throw std::logic_error("Requested a sigma type that has not yet "
+                               "been implemented");
+        return -1;
+      }
     };
 
     /** Radially-dependent template specialization of the above */
@@ -178,6 +192,12 @@ namespace rascal {
                                "been implemented");
         return -1;
       }
+      template <size_t Order, size_t Layer>
+      double get_fac_a(const ClusterRefKey<Order, Layer> & /* pair */) {
+        throw std::logic_error("Requested a sigma type that has not yet "
+                               "been implemented");
+        return -1;
+      }
     };
 
     //! Utility to make shared pointer and cast to base class
@@ -470,7 +490,7 @@ namespace rascal {
         auto smearing{downcast_atomic_smearing<AST>(this->atomic_smearing)};
 
         // a = 1 / (2*\sigma^2)
-        double fac_a{0.5 * pow(smearing->get_gaussian_sigma(center), -2)};
+        double fac_a{smearing->get_fac_a(center)};
         return this->compute_center_contribution(fac_a);
       }
 
@@ -506,9 +526,8 @@ namespace rascal {
       compute_neighbour_contribution(const double distance,
                                      const ClusterRefKey<Order, Layer> & pair) {
         auto smearing{downcast_atomic_smearing<AST>(this->atomic_smearing)};
-        double smearing_value{smearing->get_gaussian_sigma(pair)};
         // a = 1 / (2*\sigma^2)
-        double fac_a{0.5 * pow(smearing_value, -2)};
+        double fac_a{smearing->get_fac_a(pair)};
         return this->compute_neighbour_contribution(distance, fac_a);
       }
 
@@ -845,7 +864,7 @@ namespace rascal {
         auto smearing{downcast_atomic_smearing<AST>(this->atomic_smearing)};
 
         // a = 1 / (2*\sigma^2)
-        double fac_a{0.5 / pow(smearing->get_gaussian_sigma(center), 2_size_t)};
+        double fac_a{smearing->get_fac_a(center)};
         return this->compute_center_contribution(fac_a);
       }
 
@@ -868,9 +887,8 @@ namespace rascal {
       compute_neighbour_contribution(const double distance,
                                      const ClusterRefKey<Order, Layer> & pair) {
         auto smearing{downcast_atomic_smearing<AST>(this->atomic_smearing)};
-        double smearing_value{smearing->get_gaussian_sigma(pair)};
         // a = 1 / (2*\sigma^2)
-        double fac_a{0.5 / pow(smearing_value, 2_size_t)};
+        double fac_a{smearing->get_fac_a(pair)};
         return this->compute_neighbour_contribution(distance, fac_a);
       }
 
@@ -1001,7 +1019,7 @@ namespace rascal {
       void precompute_fac_a() {
         auto smearing{downcast_atomic_smearing<AtomicSmearingType::Constant>(
             this->atomic_smearing)};
-        this->fac_a = 0.5 * pow(smearing->get_gaussian_sigma(), -2);
+        this->fac_a = smearing->get_fac_a();
       }
 
       // Should be invoked only after the a-factor has been precomputed
@@ -1095,7 +1113,7 @@ namespace rascal {
       void precompute_fac_a() {
         auto smearing{downcast_atomic_smearing<AtomicSmearingType::Constant>(
             this->atomic_smearing)};
-        this->fac_a = 0.5 * pow(smearing->get_gaussian_sigma(), -2);
+        this->fac_a = smearing->get_fac_a();
       }
 
       // Should be invoked only after the a-factor has been precomputed
@@ -1431,7 +1449,7 @@ namespace rascal {
       void precompute_fac_a() {
         auto smearing{downcast_atomic_smearing<AtomicSmearingType::Constant>(
             this->atomic_smearing)};
-        this->fac_a = 0.5 * pow(smearing->get_gaussian_sigma(), -2);
+        this->fac_a = smearing->get_fac_a();
       }
 
       // Should be invoked only after the a-factor has been precomputed
@@ -8,6 +8,7 @@ from python_structure_manager_test import (
     TestNL,
     TestNLStrict,
     CenterSelectTest,
+    TestStructureList,
 )
 from python_representation_calculator_test import (
     TestSortedCoulombRepresentation,
@@ -17,7 +18,7 @@ from python_representation_calculator_test import (
 from python_models_test import TestNumericalKernelGradient, TestCosineKernel
 from python_math_test import TestMath
 from python_test_sparsify_fps import TestFPS
-from python_utils_test import TestOptimalRadialBasis
+from python_utils_test import TestOptimalRadialBasis, TestIO
 from md_calculator_test import TestGenericMD
 
 
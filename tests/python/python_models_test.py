@@ -243,7 +243,13 @@ class TestCosineKernel(unittest.TestCase):
 
         for target_type in ["Atom", "Structure"]:
             cosine_kernel = Kernel(rep, name="Cosine", target_type=target_type, zeta=2)
-            cosine_kernel(features)
+            kernel = cosine_kernel(features)
+            # the symmetric shortcut gives the same kernel as the full one
+            kernel_full = cosine_kernel._kernel.compute(
+                rep._representation, features.managers, features.managers
+            )
+            self.assertTrue(np.allclose(kernel, cosine_kernel(features, features)))
+            self.assertTrue(np.allclose(kernel, kernel_full))
 
         # wrong name
         with self.assertRaises(RuntimeError):
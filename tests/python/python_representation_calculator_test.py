@@ -3,16 +3,22 @@ from rascal.representations import (
     SphericalExpansion,
     SphericalInvariants,
 )
+from rascal.representations.spherical_invariants import (
+    get_power_spectrum_index_mapping,
+    get_power_spectrum_index_arrays,
+)
 from rascal.utils import from_dict, to_dict, FPSFilter
 from rascal.models import Kernel
 from rascal.models.sparse_points import SparsePoints
 from test_utils import load_json_frame, BoxList, Box, dot
+import ase.io
 import unittest
 import numpy as np
 import sys
 import os
 import json
 from copy import copy, deepcopy
+from itertools import product
 from scipy.stats import ortho_group
 import pickle
 
@@ -101,6 +107,26 @@ class TestSphericalExpansionRepresentation(unittest.TestCase):
 
         ref = features.get_features(rep)
 
+    def test_reuse_neighbourlist(self):
+        rep = SphericalExpansion(**self.hypers)
+        managers = rep.transform(self.frames, reuse_neighbourlist=True)
+        ref = managers.get_features(rep)
+
+        managers_reused = rep.transform(self.frames, reuse_neighbourlist=True)
+        self.assertTrue(managers_reused is managers)
+        self.assertTrue(np.allclose(ref, managers_reused.get_features(rep)))
+
+        # the default builds a new neighbourlist and does not keep it
+        managers_new = rep.transform(self.frames)
+        self.assertFalse(managers_new is managers)
+        self.assertTrue(np.allclose(ref, managers_new.get_features(rep)))
+        managers_reused = rep.transform(self.frames, reuse_neighbourlist=True)
+        self.assertTrue(managers_reused is managers)
+
+        rep.invalidate(self.frames)
+        managers_invalidated = rep.transform(self.frames, reuse_neighbourlist=True)
+        self.assertFalse(managers_invalidated is managers)
+
     def test_serialization(self):
         rep = SphericalExpansion(**self.hypers)
 
@@ -201,10 +227,12 @@ class TestSphericalExpansionRepresentation(unittest.TestCase):
 
 
 class TestSphericalInvariantsRepresentation(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         builds the test case. Test the order=1 structure manager implementation
-        against a triclinic crystal.
+        against a triclinic crystal. The structures are only read once since
+        none of the tests modify them.
         """
 
         fns = [
@@ -212,14 +240,13 @@ class TestSphericalInvariantsRepresentation(unittest.TestCase):
             os.path.join(inputs_path, "SiC_moissanite_supercell.json"),
             os.path.join(inputs_path, "methane.json"),
         ]
-        self.frames = [load_json_frame(fn) for fn in fns]
+        cls.frames = [load_json_frame(fn) for fn in fns]
 
-        global_species = []
-        for frame in self.frames:
-            global_species.extend(frame["atom_types"])
-        self.global_species = list(np.unique(global_species))
+        cls.global_species = list(
+            np.unique(np.concatenate([frame["atom_types"] for frame in cls.frames]))
+        )
 
-        self.hypers = dict(
+        cls.hypers = dict(
             soap_type="PowerSpectrum",
             interaction_cutoff=3.5,
             max_radial=6,
@@ -318,6 +345,90 @@ class TestSphericalInvariantsRepresentation(unittest.TestCase):
 
         self.assertTrue(np.allclose(KNM_ref, KNM))
 
+    def test_reuse_neighbourlist(self):
+        rep = SphericalInvariants(**self.hypers)
+        managers = rep.transform(self.frames, reuse_neighbourlist=True)
+        ref = managers.get_features(rep)
+
+        managers_reused = rep.transform(self.frames, reuse_neighbourlist=True)
+        self.assertTrue(managers_reused is managers)
+        self.assertTrue(np.allclose(ref, managers_reused.get_features(rep)))
+
+        rep.invalidate(self.frames)
+        managers_new = rep.transform(self.frames, reuse_neighbourlist=True)
+        self.assertFalse(managers_new is managers)
+        self.assertTrue(np.allclose(ref, managers_new.get_features(rep)))
+
+    def test_cutoff_function_parameters(self):
+        cutoff_function_parameters = dict(rate=1, scale=2, exponent=3)
+        rep = SphericalInvariants(
+            cutoff_function_type="RadialScaling",
+            cutoff_function_parameters=cutoff_function_parameters,
+            **self.hypers
+        )
+        # the argument is not modified by the constructor
+        self.assertEqual(cutoff_function_parameters, dict(rate=1, scale=2, exponent=3))
+        self.assertEqual(rep.cutoff_function_parameters, cutoff_function_parameters)
+
+    def test_optimization(self):
+        species = [int(sp) for sp in self.global_species]
+        projection_matrices = {
+            sp: [np.eye(6).tolist() for _ in range(7)] for sp in species
+        }
+        optimization = {
+            "Spline": {"accuracy": 1e-8},
+            "RadialDimReduction": {"projection_matrices": projection_matrices},
+        }
+        rep = SphericalInvariants(optimization=optimization, **self.hypers)
+        # the hypers do not follow later changes of the argument
+        projection_matrices[species[0]][0][0][0] = 2.0
+        rep_matrices = rep.hypers["radial_contribution"]["optimization"][
+            "RadialDimReduction"
+        ]["projection_matrices"]
+        self.assertEqual(rep_matrices[species[0]][0][0][0], 1.0)
+
+    def test_own_calculator(self):
+        # representations never share their C++ calculator
+        rep = SphericalInvariants(**self.hypers)
+        rep_same = SphericalInvariants(**self.hypers)
+        self.assertFalse(rep._representation is rep_same._representation)
+
+    def test_invalid_hypers(self):
+        # the hypers are checked when the representation is built
+        hypers = dict(self.hypers, gaussian_sigma_type="Bogus")
+        with self.assertRaises(RuntimeError):
+            SphericalInvariants(**hypers)
+
+    def test_feature_index_mapping(self):
+        frames = ase.io.read(os.path.join(inputs_path, "small_molecules-20.json"), ":")
+        rep = SphericalInvariants(**self.hypers)
+        managers = rep.transform(frames)
+        mapping = rep.get_feature_index_arrays(managers)
+        self.assertEqual(len(mapping.l), managers.get_features(rep).shape[1])
+        mapping_ase = rep.get_feature_index_arrays(frames)
+        for index, index_ase in zip(mapping, mapping_ase):
+            self.assertTrue(np.all(index == index_ase))
+        # one dictionary per feature
+        self.assertEqual(rep.get_feature_index_mapping(managers), mapping.as_dict())
+
+        with self.assertRaises(RuntimeError):
+            rep.get_feature_index_arrays([frames[0], self.frames[0]])
+
+    def test_power_spectrum_index_mapping(self):
+        sp_pairs = [[1, 1], [1, 6], [6, 6], [6, 8]]
+        n_max, l_max = 3, 4
+        mapping = get_power_spectrum_index_arrays(sp_pairs, n_max, l_max)
+        mapping_ref = {}
+        for i_feat, (sp_pair, n1, n2, l) in enumerate(
+            product(sp_pairs, range(n_max), range(n_max), range(l_max))
+        ):
+            mapping_ref[i_feat] = dict(a=sp_pair[0], b=sp_pair[1], n1=n1, n2=n2, l=l)
+        self.assertEqual(len(mapping.l), len(mapping_ref))
+        self.assertTrue(mapping.as_dict() == mapping_ref)
+        self.assertTrue(
+            get_power_spectrum_index_mapping(sp_pairs, n_max, l_max) == mapping_ref
+        )
+
     def test_serialization(self):
         rep = SphericalInvariants(**self.hypers)
 
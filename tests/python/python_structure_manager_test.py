@@ -4,6 +4,8 @@ from rascal.neighbourlist import get_neighbourlist, AtomsList
 from rascal.neighbourlist.structure_manager import (
     mask_center_atoms_by_species,
     mask_center_atoms_by_id,
+    convert_to_structure_list,
+    unpack_ase,
 )
 from test_utils import load_json_frame, BoxList, Box
 import unittest
@@ -413,3 +415,59 @@ class CenterSelectTest(unittest.TestCase):
         test_mask = np.zeros((self.natoms,), dtype="bool")
         test_mask[3] = True
         self.check_mask(test_mask)
+
+
+class TestStructureList(unittest.TestCase):
+
+    """Test the batched conversion of several structures to the internal
+    AtomicStructureList
+    """
+
+    def setUp(self):
+        fn = os.path.join(inputs_path, "small_molecules-20.json")
+        self.frames = ase.io.read(fn, ":")
+        mask_center_atoms_by_species(self.frames[1], species_select=["C"])
+
+    def test_convert_to_structure_list(self):
+        structure_list = convert_to_structure_list(self.frames)
+        self.assertEqual(len(structure_list), len(self.frames))
+        for frame, structure in zip(self.frames, structure_list):
+            ref = unpack_ase(frame)
+            self.assertTrue(np.allclose(ref["positions"], structure.get_positions()))
+            self.assertTrue(np.allclose(ref["cell"], structure.get_cell()))
+            self.assertTrue(
+                np.all(ref["atom_types"].flatten() == structure.get_atom_types())
+            )
+            self.assertTrue(np.all(ref["pbc"].flatten() == structure.get_pbc()))
+
+    def test_empty_structure_list(self):
+        structure_list = convert_to_structure_list([])
+        self.assertEqual(len(structure_list), 0)
+
+    def test_extend_inconsistent_arrays(self):
+        arrays = dict(
+            positions=np.zeros((3, 4)),
+            atom_types=np.ones(4, dtype=np.int32),
+            cells=np.tile(np.eye(3) * 10, 2),
+            pbcs=np.zeros((3, 2), dtype=np.int32),
+            center_atoms_mask=np.ones(4, dtype=bool),
+            offsets=np.array([0, 2, 4], dtype=np.int32),
+        )
+        structure_list = convert_to_structure_list([])
+        structure_list.extend(**arrays)
+        self.assertEqual(len(structure_list), 2)
+
+        wrong_arrays = [
+            dict(atom_types=np.ones(3, dtype=np.int32)),
+            dict(center_atoms_mask=np.ones(5, dtype=bool)),
+            dict(offsets=np.array([1, 2, 4], dtype=np.int32)),
+            dict(
+                cells=np.tile(np.eye(3) * 10, 3),
+                pbcs=np.zeros((3, 3), dtype=np.int32),
+                offsets=np.array([0, 3, 2, 4], dtype=np.int32),
+            ),
+        ]
+        for wrong in wrong_arrays:
+            with self.assertRaises(RuntimeError):
+                structure_list.extend(**dict(arrays, **wrong))
+        self.assertEqual(len(structure_list), 2)
@@ -7,7 +7,10 @@ from rascal.utils import (
     get_radial_basis_pca,
     get_radial_basis_projections,
     get_optimal_radial_basis_hypers,
+    dump_obj,
+    load_obj,
 )
+from rascal.utils.io import dump_json, load_json, _dump_npy, _load_npy
 
 from test_utils import load_json_frame, BoxList, Box, dot
 import unittest
@@ -18,6 +21,8 @@ import json
 from copy import copy, deepcopy
 from scipy.stats import ortho_group
 import pickle
+import tempfile
+import base64
 
 rascal_reference_path = "reference_data"
 inputs_path = os.path.join(rascal_reference_path, "inputs")
@@ -91,3 +96,91 @@ class TestOptimalRadialBasis(unittest.TestCase):
         soap_feats_2 = soap_opt_2.transform(self.frames).get_features(soap_opt_2)
 
         self.assertTrue(np.allclose(soap_feats, soap_feats_2))
+
+
+class TestIO(unittest.TestCase):
+    def setUp(self):
+        fns = [
+            os.path.join(inputs_path, "CaCrP2O7_mvc-11955_symmetrized.json"),
+            os.path.join(inputs_path, "methane.json"),
+        ]
+        self.frames = [load_json_frame(fn) for fn in fns]
+
+        max_radial, max_angular = 4, 3
+        # random orthogonal projections keyed by the atomic species
+        projection_matrices = {
+            sp: [ortho_group.rvs(max_radial).tolist() for _ in range(max_angular + 1)]
+            for sp in [1, 6, 8, 15, 20, 24]
+        }
+        self.hypers = dict(
+            soap_type="PowerSpectrum",
+            interaction_cutoff=3.5,
+            max_radial=max_radial,
+            max_angular=max_angular,
+            gaussian_sigma_constant=0.4,
+            gaussian_sigma_type="Constant",
+            cutoff_smooth_width=0.5,
+            optimization={
+                "RadialDimReduction": {"projection_matrices": projection_matrices},
+                "Spline": {"accuracy": 1e-8},
+            },
+        )
+
+    def test_dump_load_json(self):
+        data = {"a": {1: [1.0, 2.5], 3: "b"}, "c": [{"4": 5}], "d": 0.1}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, "data.json")
+            dump_json(fn, data)
+            data_loaded = load_json(fn)
+        # keys that can be converted are restored as int
+        data["c"] = [{4: 5}]
+        self.assertEqual(data_loaded, data)
+
+        # non finite floats are preserved
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, "data.json")
+            dump_json(fn, {"a": [np.nan, np.inf, 1.0]})
+            data_loaded = load_json(fn)
+        self.assertTrue(np.isnan(data_loaded["a"][0]))
+        self.assertEqual(data_loaded["a"][1:], [np.inf, 1.0])
+
+    def test_dump_load_npy(self):
+        arrays = dict(
+            a=np.random.rand(3, 4),
+            b=np.arange(5, dtype=np.int32),
+            c=np.asfortranarray(np.random.rand(2, 3)),
+            d=np.array(2.0),
+            e=np.array(
+                [(1, [0.5, 1.5]), (2, [2.5, 3.5])],
+                dtype=[("n", "<i4"), ("x", ">f8", (2,))],
+            ),
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, "data.json")
+            data = dict(arrays)
+            # arrays saved as lists or with a dtype string by previous versions
+            # can still be loaded
+            data["legacy"] = ["npy", arrays["a"].tolist()]
+            b64 = base64.b64encode(arrays["b"].data).decode("ascii")
+            data["legacy_b64"] = ["npy_b64", arrays["b"].dtype.str, [5], b64]
+            _dump_npy(fn, data, "test")
+            dump_json(fn, data)
+            data_loaded = load_json(fn)
+            _load_npy(data_loaded, tmpdir)
+
+        for k, v in arrays.items():
+            self.assertEqual(data_loaded[k].dtype, v.dtype)
+            self.assertTrue(np.array_equal(data_loaded[k], v))
+        self.assertTrue(np.array_equal(data_loaded["legacy"], arrays["a"]))
+        self.assertTrue(np.array_equal(data_loaded["legacy_b64"], arrays["b"]))
+
+    def test_dump_load_obj(self):
+        rep = SphericalInvariants(**self.hypers)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fn = os.path.join(tmpdir, "rep.json")
+            dump_obj(fn, rep)
+            rep_loaded = load_obj(fn)
+
+        features = rep.transform(self.frames).get_features(rep)
+        features_loaded = rep_loaded.transform(self.frames).get_features(rep_loaded)
+        self.assertTrue(np.allclose(features, features_loaded))